@@ -1,5 +1,86 @@
 import hashlib
-import random
+import logging
+import os
+from array import array
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+
+_LOG = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8192)
+def _hash_cached(key_str, id_mask):
+    """
+    Hash a key string to an integer in the range [0, id_mask].
+    Cached because the same keys are hashed again by get, transfer_keys and print_info.
+    
+    Uses BLAKE2b truncated to just enough bytes for the identifier space.
+    This is a simulation choice: ids differ from the SHA-1 ids in the Chord paper.
+    
+    Deliberately not numba-compiled: hashlib cannot be called from numba code,
+    and the remaining mask is a single AND, cheaper than a jitted call.
+    """
+    num_bytes = max(1, (id_mask.bit_length() + 7) // 8)
+    digest = hashlib.blake2b(key_str.encode(), digest_size=num_bytes).digest()
+    return int.from_bytes(digest, 'big') & id_mask
+
+
+def _closest_preceding_index(finger_ids, node_id, key, id_mask):
+    """
+    Return the highest finger index whose id is strictly inside (node_id, key)
+    on the ring, or -1 if there is none. Plain integer arithmetic so it can be
+    compiled with numba.
+    
+    Deliberately not memoized: a cache key would have to include the finger
+    table itself, and hashing m finger ids costs as much as this scan.
+    """
+    key_dist = (key - node_id - 1) & id_mask
+    for i in range(len(finger_ids) - 1, -1, -1):
+        if (finger_ids[i] - node_id - 1) & id_mask < key_dist:
+            return i
+    return -1
+
+
+# numba is only imported by enable_jit(); until then the pure Python search is used
+_jit_enabled = False
+
+# Identifier sizes the compiled kernel is used for. Below 16 bits a jitted call
+# is no faster than the Python search; above 63 ids no longer fit in int64.
+_JIT_MIN_BITS = 16
+_JIT_MAX_BITS = 63
+
+
+def enable_jit(m):
+    """
+    Switch the finger search to a numba-compiled kernel for m-bit networks,
+    compiling it now rather than on the first lookup. Does nothing (and never
+    imports numba) if m is outside the sizes the kernel is used for, CHORD_JIT=0
+    is set or numba is not installed. Returns True if the compiled kernel is in use.
+    """
+    global _closest_preceding_index, _jit_enabled
+    if not _JIT_MIN_BITS <= m <= _JIT_MAX_BITS:
+        return False
+    if _jit_enabled:
+        return True
+    if os.environ.get("CHORD_JIT", "1") != "1":
+        return False
+    
+    # Keep numba's on-disk compile cache next to this file
+    os.environ.setdefault(
+        "NUMBA_CACHE_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), ".numba_cache"),
+    )
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; the pure Python lookup is used instead
+        return False
+    
+    kernel = njit(cache=True)(_closest_preceding_index)
+    kernel(array('q', [0]), 0, 0, 1)
+    _closest_preceding_index = kernel
+    _jit_enabled = True
+    return True
 
 
 class ChordNode:
@@ -8,29 +89,46 @@ class ChordNode:
     Each node maintains a finger table and handles key-value storage.
     """
     
-    def __init__(self, node_id, m=8):
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = ('id', 'm', 'max_nodes', '_id_mask', '_finger_starts', '_pred_starts',
+                 'successor', 'predecessor', 'successors', 'finger_ids', 'finger_nodes', 'data')
+    
+    def __init__(self, node_id, m=8, r=3):
         """
         Initialize a Chord node.
         
         Args:
             node_id: Unique identifier for the node
             m: Number of bits in the identifier space (default 8, supports 0-255)
+            r: Length of the successor list (default 3, 0 disables it)
         """
         self.id = node_id
         self.m = m
-        self.max_nodes = 2 ** m
+        self.max_nodes = 1 << m
+        self._id_mask = self.max_nodes - 1
+        
+        # Ring positions n + 2^i and n - 2^i never change for a node.
+        # max_nodes is a power of two, so "& _id_mask" is "% max_nodes".
+        self._finger_starts = tuple((node_id + (1 << i)) & self._id_mask for i in range(m))
+        self._pred_starts = tuple((node_id - (1 << i)) & self._id_mask for i in range(m))
         
         # Successor and predecessor pointers
         self.successor = self
         self.predecessor = None
         
-        # Finger table: stores m entries
-        self.finger_table = [None] * m
+        # Next r nodes clockwise, refreshed by stabilize()
+        self.successors = deque(maxlen=r)
+        
+        # Finger table: stores m entries, split into parallel arrays of
+        # node ids (for ring arithmetic) and node references (for routing).
+        # Keep them in step through set_finger.
+        self.finger_ids = array('q', [0] * m) if m <= 63 else [0] * m
+        self.finger_nodes = [None] * m
         
         # Data storage (key-value pairs this node is responsible for)
         self.data = {}
         
-        print(f"[Node {self.id}] Created")
+        _LOG.debug("[Node %d] Created", self.id)
     
     def __str__(self):
         return f"Node {self.id}"
@@ -40,32 +138,21 @@ class ChordNode:
     
     # ==================== HELPER FUNCTIONS ====================
     
-    def in_range(self, key, start, end, inclusive_start=False, inclusive_end=False):
+    def _in_open(self, key, start, end):
         """
-        Check if key is in the range (start, end) on the Chord ring.
-        Handles wrap-around cases.
+        Check if key is in the open range (start, end) on the Chord ring.
+        Uses clockwise distance from start, so wrap-around needs no branch.
+        When start == end the range is the whole ring except start.
         """
-        if start == end:
-            return inclusive_start or inclusive_end
-        
-        if start < end:
-            if inclusive_start and inclusive_end:
-                return start <= key <= end
-            elif inclusive_start:
-                return start <= key < end
-            elif inclusive_end:
-                return start < key <= end
-            else:
-                return start < key < end
-        else:  # Wrap-around case
-            if inclusive_start and inclusive_end:
-                return key >= start or key <= end
-            elif inclusive_start:
-                return key >= start or key < end
-            elif inclusive_end:
-                return key > start or key <= end
-            else:
-                return key > start or key < end
+        return (key - start - 1) & self._id_mask < (end - start - 1) & self._id_mask
+    
+    def _in_half_open_end(self, key, start, end):
+        """Check if key is in the range (start, end] on the Chord ring."""
+        return (key - start - 1) & self._id_mask <= (end - start - 1) & self._id_mask
+    
+    def _in_half_open_start(self, key, start, end):
+        """Check if key is in the range [start, end) on the Chord ring."""
+        return (key - start) & self._id_mask <= (end - start - 1) & self._id_mask
     
     def distance(self, from_id, to_id):
         """Calculate clockwise distance on the ring"""
@@ -76,14 +163,29 @@ class ChordNode:
     
     # ==================== FINGER TABLE ====================
     
+    def set_finger(self, i, node):
+        """Point finger i at node, keeping finger_ids and finger_nodes in step"""
+        self.finger_nodes[i] = node
+        self.finger_ids[i] = node.id
+        if i == 0:
+            # finger[0] is the successor
+            self.successor = node
+    
+    def set_finger_table(self, nodes):
+        """
+        Replace the whole finger table with the given m nodes.
+        Used when the network builds the ring directly instead of via join().
+        """
+        for i, node in enumerate(nodes):
+            self.set_finger(i, node)
+    
     def init_finger_table(self, existing_node):
         """
         Initialize finger table using an existing node in the network.
         This is called during the JOIN process.
         """
         # finger[0] = successor
-        self.finger_table[0] = existing_node.find_successor((self.id + 1) % self.max_nodes)
-        self.successor = self.finger_table[0]
+        self.set_finger(0, existing_node.find_successor((self.id + 1) & self._id_mask))
         
         # Get predecessor from successor
         self.predecessor = self.successor.predecessor
@@ -91,16 +193,15 @@ class ChordNode:
         
         # Initialize rest of finger table
         for i in range(self.m - 1):
-            finger_start = (self.id + 2 ** (i + 1)) % self.max_nodes
+            finger_start = self._finger_starts[i + 1]
             
             # If finger_start is in range [n, finger[i]], finger[i+1] = finger[i]
-            if self.in_range(finger_start, self.id, self.finger_table[i].id, 
-                           inclusive_start=True, inclusive_end=False):
-                self.finger_table[i + 1] = self.finger_table[i]
+            if self._in_half_open_start(finger_start, self.id, self.finger_ids[i]):
+                self.set_finger(i + 1, self.finger_nodes[i])
             else:
-                self.finger_table[i + 1] = existing_node.find_successor(finger_start)
+                self.set_finger(i + 1, existing_node.find_successor(finger_start))
         
-        print(f"[Node {self.id}] Finger table initialized")
+        _LOG.debug("[Node %d] Finger table initialized", self.id)
     
     def update_finger_table(self, s, i):
         """
@@ -108,24 +209,36 @@ class ChordNode:
         s: the node that might be the i-th finger
         i: finger table index
         """
-        finger_start = (self.id + 2 ** i) % self.max_nodes
-        
-        # If s is in the range [n, finger[i])
-        if self.in_range(s.id, self.id, self.finger_table[i].id, 
-                        inclusive_start=True, inclusive_end=False):
-            self.finger_table[i] = s
-            p = self.predecessor
-            if p and p != self:
-                p.update_finger_table(s, i)
+        # Walk back through predecessors while s is in the range [n, finger[i])
+        node = self
+        while node._in_half_open_start(s.id, node.id, node.finger_ids[i]):
+            node.set_finger(i, s)
+            p = node.predecessor
+            if not p or p is node or p is s:
+                break
+            node = p
     
     def fix_fingers(self):
         """
         Periodically called to update finger table entries.
         Part of the stabilization protocol.
         """
-        for i in range(self.m):
-            finger_start = (self.id + 2 ** i) % self.max_nodes
-            self.finger_table[i] = self.find_successor(finger_start)
+        fingers = self.finger_nodes
+        starts = self._finger_starts
+        node = self.find_successor(starts[0])
+        if fingers[0] is not node:
+            self.set_finger(0, node)
+        for i in range(1, self.m):
+            prev = fingers[i - 1]
+            # If finger_start is in range (n, finger[i-1]], finger[i] = finger[i-1];
+            # otherwise the lookup can start from finger[i-1] instead of n
+            if self._in_half_open_end(starts[i], self.id, self.finger_ids[i - 1]):
+                node = prev
+            else:
+                node = prev.find_successor(starts[i])
+            # Most fingers are unchanged between rounds; skip the write
+            if fingers[i] is not node:
+                self.set_finger(i, node)
     
     # ==================== LOOKUP ====================
     
@@ -134,28 +247,71 @@ class ChordNode:
         Find the successor node responsible for the given key.
         This is the core lookup operation in Chord.
         """
-        # If key is between this node and its successor
-        if self.in_range(key, self.id, self.successor.id, 
-                        inclusive_end=True):
-            return self.successor
-        else:
+        return self._route(key)[0]
+    
+    def _route(self, key):
+        """
+        Find the successor node for key, together with the number of hops
+        (forwards to another node) the query took.
+        """
+        in_range = self._in_half_open_end
+        
+        # Keys just past this node are answered from the successor list.
+        # Stop at the first stale entry (e.g. a node that has left).
+        prev = self
+        for succ in self.successors:
+            if prev.successor is not succ:
+                break
+            if in_range(key, prev.id, succ.id):
+                return succ, 0
+            prev = succ
+        
+        node = self
+        hops = 0
+        # Walk the ring until key is between node and its successor
+        while not in_range(key, node.id, node.successor.id):
             # Forward the query to the closest preceding node
-            node = self.closest_preceding_node(key)
-            if node == self:
-                return self.successor
-            return node.find_successor(key)
+            nxt = node.closest_preceding_node(key)
+            if nxt is node:
+                break
+            node = nxt
+            hops += 1
+        return node.successor, hops
     
     def closest_preceding_node(self, key):
         """
         Find the closest node that precedes the key in the finger table.
         """
+        fingers = self.finger_nodes
+        finger_ids = self.finger_ids
+        # Tables are always filled in index order, so a set last entry means a full table
+        complete = fingers[-1] is not None
+        # The jitted call only beats the Python search below on larger tables
+        if _jit_enabled and _JIT_MIN_BITS <= self.m <= _JIT_MAX_BITS and complete:
+            i = _closest_preceding_index(finger_ids, self.id, key, self._id_mask)
+            return fingers[i] if i >= 0 else self
+        
+        if self.m > 8 and complete:
+            # Fingers are ordered by clockwise distance from this node, so
+            # binary search for the last one strictly inside (n, key)
+            id_mask = self._id_mask
+            node_id = self.id
+            key_dist = (key - node_id - 1) & id_mask
+            lo, hi = 0, self.m
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if (finger_ids[mid] - node_id - 1) & id_mask < key_dist:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo and (finger_ids[lo - 1] - node_id - 1) & id_mask < key_dist:
+                return fingers[lo - 1]
+            # Nothing found: the table may be out of order mid-stabilization
+        
         # Search finger table from end to beginning
         for i in range(self.m - 1, -1, -1):
-            if self.finger_table[i] and self.in_range(
-                self.finger_table[i].id, self.id, key,
-                inclusive_start=False, inclusive_end=False
-            ):
-                return self.finger_table[i]
+            if fingers[i] and self._in_open(finger_ids[i], self.id, key):
+                return fingers[i]
         return self
     
     # ==================== JOIN FUNCTION ====================
@@ -168,7 +324,7 @@ class ChordNode:
             existing_node: A node already in the network (None if first node)
         """
         if existing_node:
-            print(f"[Node {self.id}] Joining network through Node {existing_node.id}")
+            _LOG.debug("[Node %d] Joining network through Node %d", self.id, existing_node.id)
             
             # Initialize finger table using existing node
             self.init_finger_table(existing_node)
@@ -179,33 +335,40 @@ class ChordNode:
             # Transfer keys from successor
             self.transfer_keys()
             
-            print(f"[Node {self.id}] Successfully joined the network")
+            _LOG.debug("[Node %d] Successfully joined the network", self.id)
         else:
             # First node in the network
-            print(f"[Node {self.id}] Creating new Chord network")
+            _LOG.debug("[Node %d] Creating new Chord network", self.id)
             for i in range(self.m):
-                self.finger_table[i] = self
+                self.set_finger(i, self)
             self.predecessor = self
-            self.successor = self
     
     def update_others(self):
         """
         Update finger tables of existing nodes after joining.
         """
+        last_p = None
         for i in range(self.m):
-            # Find last node p whose i-th finger might be this node
-            p_id = (self.id - 2 ** i) % self.max_nodes
-            p = self.find_predecessor(p_id)
+            # Find last node p whose i-th finger might be this node.
+            # Consecutive targets are often still covered by the previous p.
+            p_id = self._pred_starts[i]
+            if last_p is not None and self._in_half_open_end(p_id, last_p.id, last_p.successor.id):
+                p = last_p
+            else:
+                p = last_p = self.find_predecessor(p_id)
             if p and p != self:
                 p.update_finger_table(self, i)
     
     def find_predecessor(self, key):
         """Find the predecessor of a given key"""
+        in_range = self._in_half_open_end
         node = self
-        while not self.in_range(key, node.id, node.successor.id, 
-                               inclusive_end=True):
-            node = node.closest_preceding_node(key)
-            if node == self:
+        while not in_range(key, node.id, node.successor.id):
+            nxt = node.closest_preceding_node(key)
+            if nxt is node:
+                break
+            node = nxt
+            if node is self:
                 break
         return node
     
@@ -221,24 +384,27 @@ class ChordNode:
         
         # If successor's predecessor is between this node and successor,
         # it should be our new successor
-        if x and x != self and self.in_range(
-            x.id, self.id, self.successor.id,
-            inclusive_start=False, inclusive_end=False
-        ):
-            self.successor = x
-            self.finger_table[0] = x
+        if x and x != self and self._in_open(x.id, self.id, self.successor.id):
+            self.set_finger(0, x)
         
         # Notify successor that this node might be its predecessor
         self.successor.notify(self)
+        
+        # Successor list = successor followed by the start of its own list
+        # (copied first: in a one-node ring the successor's list is our own)
+        successors = self.successors
+        if not successors.maxlen:
+            return  # r=0: successor list disabled
+        tail = list(islice(self.successor.successors, successors.maxlen - 1))
+        successors.clear()
+        successors.append(self.successor)
+        successors.extend(tail)
     
     def notify(self, node):
         """
         Called by another node thinking it might be our predecessor.
         """
-        if self.predecessor is None or self.in_range(
-            node.id, self.predecessor.id, self.id,
-            inclusive_start=False, inclusive_end=False
-        ):
+        if self.predecessor is None or self._in_open(node.id, self.predecessor.id, self.id):
             self.predecessor = node
     
     def check_predecessor(self):
@@ -247,7 +413,7 @@ class ChordNode:
         In simulation, we just check if it's None.
         """
         if self.predecessor and not self.is_alive(self.predecessor):
-            print(f"[Node {self.id}] Predecessor {self.predecessor.id} failed")
+            _LOG.debug("[Node %d] Predecessor %d failed", self.id, self.predecessor.id)
             self.predecessor = None
     
     def is_alive(self, node):
@@ -264,26 +430,26 @@ class ChordNode:
         Gracefully leave the Chord network.
         Transfer keys to successor and update pointers.
         """
-        print(f"[Node {self.id}] Leaving the network")
+        _LOG.debug("[Node %d] Leaving the network", self.id)
         
         # Transfer all keys to successor
         if self.successor and self.successor != self:
-            print(f"[Node {self.id}] Transferring {len(self.data)} keys to Node {self.successor.id}")
+            _LOG.debug("[Node %d] Transferring %d keys to Node %d",
+                       self.id, len(self.data), self.successor.id)
             for key, value in self.data.items():
                 self.successor.data[key] = value
             self.data.clear()
         
         # Update predecessor's successor
         if self.predecessor and self.predecessor != self:
-            self.predecessor.successor = self.successor
-            if self.predecessor.finger_table:
-                self.predecessor.finger_table[0] = self.successor
+            if self.predecessor.finger_nodes:
+                self.predecessor.set_finger(0, self.successor)
         
         # Update successor's predecessor
         if self.successor and self.successor != self:
             self.successor.predecessor = self.predecessor
         
-        print(f"[Node {self.id}] Left the network")
+        _LOG.debug("[Node %d] Left the network", self.id)
     
     # ==================== DATA OPERATIONS ====================
     
@@ -294,7 +460,8 @@ class ChordNode:
         key_hash = self.hash_key(key)
         responsible_node = self.find_successor(key_hash)
         responsible_node.data[key] = value
-        print(f"[Node {self.id}] PUT '{key}' -> '{value}' (hash={key_hash}, stored at Node {responsible_node.id})")
+        _LOG.debug("[Node %d] PUT '%s' -> '%s' (hash=%d, stored at Node %d)",
+                   self.id, key, value, key_hash, responsible_node.id)
         return responsible_node
     
     def get(self, key):
@@ -304,16 +471,23 @@ class ChordNode:
         key_hash = self.hash_key(key)
         responsible_node = self.find_successor(key_hash)
         value = responsible_node.data.get(key, None)
-        print(f"[Node {self.id}] GET '{key}' (hash={key_hash}, from Node {responsible_node.id}) = {value}")
+        _LOG.debug("[Node %d] GET '%s' (hash=%d, from Node %d) = %s",
+                   self.id, key, key_hash, responsible_node.id, value)
         return value
     
+    def lookup(self, key):
+        """
+        Retrieve a value without logging anything.
+        Returns (hop_count, value); value is None if the key is not stored.
+        """
+        responsible_node, hops = self._route(self.hash_key(key))
+        return hops, responsible_node.data.get(key)
+    
     def hash_key(self, key):
         """
         Hash a key to an integer in the range [0, 2^m - 1].
         """
-        hash_obj = hashlib.sha1(str(key).encode())
-        hash_int = int(hash_obj.hexdigest(), 16)
-        return hash_int % self.max_nodes
+        return _hash_cached(str(key), self._id_mask)
     
     def transfer_keys(self):
         """
@@ -322,19 +496,23 @@ class ChordNode:
         if not self.successor or self.successor == self:
             return
         
-        keys_to_transfer = []
-        for key in list(self.successor.data.keys()):
-            key_hash = self.hash_key(key)
+        successor_data = self.successor.data
+        pred_id = self.predecessor.id if self.predecessor else self.id
+        
+        # Collect in one pass (no mutation while iterating), then move
+        moved = {}
+        for key, value in successor_data.items():
             # If key should be stored at this node
-            if self.in_range(key_hash, self.predecessor.id if self.predecessor else self.id, 
-                           self.id, inclusive_end=True):
-                keys_to_transfer.append(key)
+            if self._in_half_open_end(self.hash_key(key), pred_id, self.id):
+                moved[key] = value
         
-        for key in keys_to_transfer:
-            self.data[key] = self.successor.data.pop(key)
+        for key in moved:
+            del successor_data[key]
+        self.data.update(moved)
         
-        if keys_to_transfer:
-            print(f"[Node {self.id}] Transferred {len(keys_to_transfer)} keys from Node {self.successor.id}")
+        if moved:
+            _LOG.debug("[Node %d] Transferred %d keys from Node %d",
+                       self.id, len(moved), self.successor.id)
     
     # ==================== DISPLAY FUNCTIONS ====================
     
@@ -347,9 +525,9 @@ class ChordNode:
         print(f"Successor: {self.successor.id if self.successor else 'None'}")
         print(f"\nFinger Table:")
         for i in range(self.m):
-            start = (self.id + 2 ** i) % self.max_nodes
-            if self.finger_table[i]:
-                print(f"  finger[{i}]: start={start:3d}, node={self.finger_table[i].id:3d}")
+            start = self._finger_starts[i]
+            if self.finger_nodes[i]:
+                print(f"  finger[{i}]: start={start:3d}, node={self.finger_ids[i]:3d}")
         print(f"\nStored Keys: {len(self.data)}")
         if self.data:
             for key, value in self.data.items():
@@ -9,7 +9,9 @@ This script demonstrates the Chord DHT protocol including:
 """
 
 from ChordNode import ChordNode
-import time
+import bisect
+import logging
+import sys
 
 
 class ChordNetwork:
@@ -26,6 +28,8 @@ class ChordNetwork:
         """
         self.m = m
         self.nodes = {}  # Dictionary of active nodes: {node_id: ChordNode}
+        self._sorted_ids = []  # Active node IDs in ring order, kept sorted on add/remove
+        self._entry = None  # Any live node, used as the starting point for joins and requests
         
     def add_node(self, node_id):
         """
@@ -42,10 +46,12 @@ class ChordNetwork:
             new_node.join(None)
         else:
             # Join through any existing node
-            existing_node = list(self.nodes.values())[0]
-            new_node.join(existing_node)
+            new_node.join(self._entry)
         
         self.nodes[node_id] = new_node
+        bisect.insort(self._sorted_ids, node_id)
+        if self._entry is None:
+            self._entry = new_node
         return new_node
     
     def remove_node(self, node_id):
@@ -59,6 +65,194 @@ class ChordNetwork:
         node = self.nodes[node_id]
         node.leave()
         del self.nodes[node_id]
+        del self._sorted_ids[bisect.bisect_left(self._sorted_ids, node_id)]
+        if self._entry is node:
+            self._entry = next(iter(self.nodes.values()), None)
+    
+    def bulk_add(self, node_ids):
+        """
+        Add several nodes at once.
+        All nodes are spliced into the ring first, then finger tables,
+        successor lists and key ownership are rebuilt in a single pass,
+        instead of running a full join (and its finger updates) per node.
+        """
+        added = False
+        for node_id in sorted(node_ids):
+            if node_id in self.nodes:
+                print(f"Node {node_id} already exists!")
+                continue
+            self._splice_in(node_id)
+            added = True
+        
+        if added:
+            self._rebuild_fingers()
+            self._redistribute_keys()
+    
+    def build_from_sorted(self, node_ids):
+        """
+        Build an empty network directly from strictly increasing node IDs.
+        Because the ring order is already known, nodes are created and wired
+        in one pass with no joins and no stabilization rounds.
+        """
+        if self.nodes:
+            print("Network already has nodes!")
+            return
+        
+        node_ids = list(node_ids)
+        if any(a >= b for a, b in zip(node_ids, node_ids[1:])):
+            print("Node IDs must be strictly increasing!")
+            return
+        if node_ids and not (0 <= node_ids[0] and node_ids[-1] < (1 << self.m)):
+            print(f"Node IDs must be in the range 0-{(1 << self.m) - 1}!")
+            return
+        
+        self.nodes = {node_id: ChordNode(node_id, self.m) for node_id in node_ids}
+        self._sorted_ids = node_ids
+        if self._sorted_ids:
+            self._entry = self.nodes[self._sorted_ids[0]]
+            self._rebuild_fingers()
+    
+    def _splice_in(self, node_id):
+        """
+        Create a node and link it between its ring neighbours.
+        Only predecessor/successor pointers are set; fingers are left to
+        _rebuild_fingers().
+        """
+        new_node = ChordNode(node_id, self.m)
+        self.nodes[node_id] = new_node
+        bisect.insort(self._sorted_ids, node_id)
+        if self._entry is None:
+            self._entry = new_node
+        
+        ids = self._sorted_ids
+        idx = bisect.bisect_left(ids, node_id)
+        predecessor = self.nodes[ids[idx - 1]]
+        successor = self.nodes[ids[(idx + 1) % len(ids)]]
+        
+        new_node.predecessor = predecessor
+        new_node.successor = successor
+        predecessor.successor = new_node
+        successor.predecessor = new_node
+        return new_node
+    
+    def _successor_id(self, key):
+        """ID of the node responsible for key: first node ID >= key, wrapping to the smallest"""
+        ids = self._sorted_ids
+        return ids[bisect.bisect_left(ids, key) % len(ids)]
+    
+    def _ids_in_range(self, start, end):
+        """Node IDs in the ring range (start, end]; the whole ring if start == end"""
+        ids = self._sorted_ids
+        lo = bisect.bisect_right(ids, start)
+        hi = bisect.bisect_right(ids, end)
+        if start < end:
+            return ids[lo:hi]
+        return ids[lo:] + ids[:hi]
+    
+    def _finger_targets(self, node_id):
+        """The m nodes that node_id's finger table should point at"""
+        mask = (1 << self.m) - 1
+        return [self.nodes[self._successor_id((node_id + (1 << i)) & mask)]
+                for i in range(self.m)]
+    
+    def _refresh_successors(self, idx):
+        """Rebuild the successor list of the node at position idx (wraps) in the sorted IDs"""
+        ids = self._sorted_ids
+        node = self.nodes[ids[idx % len(ids)]]
+        node.successors.clear()
+        node.successors.extend(
+            self.nodes[ids[(idx + k) % len(ids)]] for k in range(1, node.successors.maxlen + 1)
+        )
+    
+    def _rebuild_fingers(self):
+        """
+        Fill every node's finger table and successor list directly from the
+        sorted node IDs: finger[i] is the first node >= (n + 2^i) mod 2^m.
+        """
+        ids = self._sorted_ids
+        for idx, node_id in enumerate(ids):
+            node = self.nodes[node_id]
+            node.predecessor = self.nodes[ids[idx - 1]]
+            node.set_finger_table(self._finger_targets(node_id))
+            self._refresh_successors(idx)
+    
+    def _redistribute_keys(self):
+        """Move every stored key to the node now responsible for its hash"""
+        for node_id in self._sorted_ids:
+            node = self.nodes[node_id]
+            moved = {}
+            for key, value in node.data.items():
+                owner = self._successor_id(node.hash_key(key))
+                if owner != node_id:
+                    moved.setdefault(owner, {})[key] = value
+            for owner, batch in moved.items():
+                for key in batch:
+                    del node.data[key]
+                self.nodes[owner].data.update(batch)
+    
+    def bulk_put(self, keys, values):
+        """
+        Store many key-value pairs in one pass.
+        Instead of routing each put through the ring, every key goes straight
+        to the node responsible for its hash, found by binary search over the
+        sorted node IDs.
+        """
+        if not self.nodes:
+            print("No nodes in network!")
+            return
+        
+        keys, values = list(keys), list(values)
+        if len(keys) != len(values):
+            print(f"Got {len(keys)} keys but {len(values)} values!")
+            return
+        
+        hash_key = self.nodes[self._sorted_ids[0]].hash_key
+        batches = {}
+        for key, value in zip(keys, values):
+            owner = self._successor_id(hash_key(key))
+            batches.setdefault(owner, {})[key] = value
+        
+        for node_id, batch in batches.items():
+            self.nodes[node_id].data.update(batch)
+    
+    def stabilize_incremental(self, changed_id):
+        """
+        Repair routing after a single join or leave at changed_id.
+        
+        Only fingers that can involve changed_id are recomputed: finger[i] of
+        every node whose start n + 2^i falls in (pred(changed_id), changed_id].
+        The changed node's own table (after a join) and the successor lists
+        just before it are refreshed as well. Cheaper than stabilize_network(),
+        which recomputes every finger of every node.
+        """
+        print(f"\n{'='*60}")
+        print(f"Running Incremental Stabilization (around Node {changed_id})")
+        print(f"{'='*60}")
+        
+        ids = self._sorted_ids
+        if not ids:
+            return
+        
+        mask = (1 << self.m) - 1
+        idx = bisect.bisect_left(ids, changed_id)
+        prev_id = ids[idx - 1]  # predecessor of changed_id, wrapping
+        
+        for i in range(self.m):
+            step = 1 << i
+            for node_id in self._ids_in_range((prev_id - step) & mask, (changed_id - step) & mask):
+                owner = self._successor_id((node_id + step) & mask)
+                self.nodes[node_id].set_finger(i, self.nodes[owner])
+        
+        if changed_id in self.nodes:
+            # Joined: make its own state exact too
+            node = self.nodes[changed_id]
+            node.predecessor = self.nodes[prev_id]
+            node.set_finger_table(self._finger_targets(changed_id))
+            self._refresh_successors(idx)
+        
+        # Nodes whose successor lists can include changed_id
+        for k in range(1, self.nodes[prev_id].successors.maxlen + 1):
+            self._refresh_successors(idx - k)
     
     def stabilize_network(self, rounds=3):
         """
@@ -68,9 +262,10 @@ class ChordNetwork:
         print(f"Running Stabilization ({rounds} rounds)")
         print(f"{'='*60}")
         
+        nodes = list(self.nodes.values())
         for round_num in range(rounds):
             print(f"\n--- Stabilization Round {round_num + 1} ---")
-            for node in self.nodes.values():
+            for node in nodes:
                 node.stabilize()
                 node.check_predecessor()
                 node.fix_fingers()
@@ -83,9 +278,9 @@ class ChordNetwork:
         print(f"CHORD NETWORK STATUS")
         print(f"{'#'*60}")
         print(f"Total Nodes: {len(self.nodes)}")
-        print(f"Node IDs: {sorted(self.nodes.keys())}")
+        print(f"Node IDs: {self._sorted_ids}")
         
-        for node_id in sorted(self.nodes.keys()):
+        for node_id in self._sorted_ids:
             self.nodes[node_id].print_info()
     
     def visualize_ring(self):
@@ -100,7 +295,7 @@ class ChordNetwork:
         print("CHORD RING VISUALIZATION")
         print(f"{'='*60}")
         
-        sorted_ids = sorted(self.nodes.keys())
+        sorted_ids = self._sorted_ids
         print("\nRing structure (clockwise):")
         for i, node_id in enumerate(sorted_ids):
             node = self.nodes[node_id]
@@ -194,7 +389,7 @@ def demo_key_storage():
     
     # Show which node stores which keys
     print("\n### Key distribution across nodes ###")
-    for node_id in sorted(network.nodes.keys()):
+    for node_id in network._sorted_ids:
         node = network.nodes[node_id]
         if node.data:
             print(f"Node {node_id} stores: {list(node.data.keys())}")
@@ -236,7 +431,7 @@ def demo_node_join():
     
     # Check key distribution after join
     print("\n### Key distribution after node join ###")
-    for node_id in sorted(network.nodes.keys()):
+    for node_id in network._sorted_ids:
         node = network.nodes[node_id]
         if node.data:
             print(f"Node {node_id} stores: {list(node.data.keys())}")
@@ -272,7 +467,7 @@ def demo_node_leave():
     
     # Show data distribution
     print("\n### Data distribution before node leaves ###")
-    for node_id in sorted(network.nodes.keys()):
+    for node_id in network._sorted_ids:
         node = network.nodes[node_id]
         if node.data:
             print(f"Node {node_id} stores: {list(node.data.keys())}")
@@ -294,7 +489,7 @@ def demo_node_leave():
     network.nodes[120].get("log.txt")
     
     print("\n### Data distribution after node leaves ###")
-    for node_id in sorted(network.nodes.keys()):
+    for node_id in network._sorted_ids:
         node = network.nodes[node_id]
         if node.data:
             print(f"Node {node_id} stores: {list(node.data.keys())}")
@@ -387,4 +582,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Node events are logged at DEBUG; show them as part of the demo output.
+    # Only the node logger is lowered, so other libraries (e.g. numba) stay quiet.
+    logging.basicConfig(level=logging.WARNING, format="%(message)s", stream=sys.stdout)
+    logging.getLogger("ChordNode").setLevel(logging.DEBUG)
     main()
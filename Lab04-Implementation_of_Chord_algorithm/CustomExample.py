@@ -4,10 +4,39 @@ A simple example showing how to use the Chord implementation
 for your own experiments and testing.
 """
 
-from ChordNode import ChordNode
+import logging
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from ChordNode import ChordNode, enable_jit
 from ChordSimulation import ChordNetwork
 
 
+def _emit(lines):
+    """Write a block of output lines with a single write call"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _print_distribution(network, counts_only=False):
+    """List the keys (or just the key count) of every node that stores data, in ring order"""
+    lines = []
+    for nid in network._sorted_ids:
+        data = network.nodes[nid].data
+        if data:
+            lines.append(f"   Node {nid}: {len(data)} keys" if counts_only
+                         else f"   Node {nid}: {list(data.keys())}")
+    _emit(lines)
+
+
+def _pause(msg):
+    """Wait for Enter, unless stdin is not a terminal or CHORD_NO_PAUSE=1 is set"""
+    if sys.stdin.isatty() and os.environ.get("CHORD_NO_PAUSE") != "1":
+        input(msg)
+
+
 def simple_example():
     """
     Simple example demonstrating basic Chord operations.
@@ -22,10 +51,7 @@ def simple_example():
     
     # Add some nodes
     print("\n2. Adding nodes 5, 15, 30, 45...")
-    network.add_node(5)
-    network.add_node(15)
-    network.add_node(30)
-    network.add_node(45)
+    network.bulk_add([5, 15, 30, 45])
     
     # Stabilize the network
     print("\n3. Running stabilization...")
@@ -44,16 +70,14 @@ def simple_example():
     
     # Retrieve data from different nodes
     print("\n6. Retrieving data from different nodes...")
-    network.nodes[15].get("alice.txt")
-    network.nodes[30].get("bob.txt")
-    network.nodes[45].get("charlie.txt")
+    lookups = [(15, "alice.txt"), (30, "bob.txt"), (45, "charlie.txt")]
+    results = [network.nodes[nid].lookup(key) for nid, key in lookups]
+    _emit([f"   {key} = {value} (queried at Node {nid}, hops={hops})"
+           for (nid, key), (hops, value) in zip(lookups, results)])
     
     # Show data distribution
     print("\n7. Data distribution:")
-    for node_id in sorted(network.nodes.keys()):
-        node = network.nodes[node_id]
-        if node.data:
-            print(f"   Node {node_id}: {list(node.data.keys())}")
+    _print_distribution(network)
     
     return network
 
@@ -81,38 +105,30 @@ def test_join_and_leave():
     network.nodes[10].put("test3", "data3")
     
     print("\n3. Data before new node joins:")
-    for node_id in sorted(network.nodes.keys()):
-        node = network.nodes[node_id]
-        if node.data:
-            print(f"   Node {node_id}: {list(node.data.keys())}")
+    _print_distribution(network)
     
     # Add new node
     print("\n4. Adding new node 40...")
     network.add_node(40)
-    network.stabilize_network(rounds=2)
+    network.stabilize_incremental(40)
     
     print("\n5. Data after node 40 joins:")
-    for node_id in sorted(network.nodes.keys()):
-        node = network.nodes[node_id]
-        if node.data:
-            print(f"   Node {node_id}: {list(node.data.keys())}")
+    _print_distribution(network)
     
     # Remove node
     print("\n6. Removing node 30...")
     network.remove_node(30)
-    network.stabilize_network(rounds=2)
+    network.stabilize_incremental(30)
     
     print("\n7. Data after node 30 leaves:")
-    for node_id in sorted(network.nodes.keys()):
-        node = network.nodes[node_id]
-        if node.data:
-            print(f"   Node {node_id}: {list(node.data.keys())}")
+    _print_distribution(network)
     
     # Verify data is still accessible
     print("\n8. Verifying all data is still accessible:")
-    network.nodes[10].get("test1")
-    network.nodes[40].get("test2")
-    network.nodes[50].get("test3")
+    lookups = [(10, "test1"), (40, "test2"), (50, "test3")]
+    results = [network.nodes[nid].lookup(key) for nid, key in lookups]
+    _emit([f"   {key}: {value} (queried at Node {nid}, hops={hops})"
+           for (nid, key), (hops, value) in zip(lookups, results)])
     
     print("\n✓ All data successfully retrieved!")
 
@@ -128,11 +144,7 @@ def test_finger_tables():
     # Create network
     print("\n1. Creating network with nodes 0, 20, 40, 60, 80, 100...")
     network = ChordNetwork(m=7)  # 0-127
-    
-    for node_id in [0, 20, 40, 60, 80, 100]:
-        network.add_node(node_id)
-    
-    network.stabilize_network(rounds=2)
+    network.build_from_sorted([0, 20, 40, 60, 80, 100])
     
     # Display finger tables
     print("\n2. Detailed finger table for Node 20:")
@@ -151,38 +163,99 @@ def stress_test():
     # Create network with many nodes
     print("\n1. Creating network with 20 random nodes...")
     network = ChordNetwork(m=8)
+    # Compiles the finger search only for identifier spaces where it helps;
+    # at m=8 this returns straight away without importing numba
+    enable_jit(network.m)
     
-    import random
-    nodes_to_add = random.sample(range(0, 256), 20)
-    nodes_to_add.sort()
+    # Fixed seed so every run (and every timing) uses the same ring and lookups
+    rng = random.Random(0xC40D)
+    nodes_to_add = sorted(rng.sample(range(256), 20))
     
     print(f"   Node IDs: {nodes_to_add}")
     
-    for node_id in nodes_to_add:
-        network.add_node(node_id)
+    network.bulk_add(nodes_to_add)
     
     print("\n2. Stabilizing network...")
     network.stabilize_network(rounds=3)
     
     print("\n3. Adding 50 key-value pairs...")
-    for i in range(50):
-        key = f"key_{i}"
-        value = f"value_{i}"
-        network.nodes[nodes_to_add[0]].put(key, value)
+    keys = [f"key_{i}" for i in range(50)]
+    values = [f"value_{i}" for i in range(50)]
+    network.bulk_put(keys, values)
     
     print("\n4. Data distribution:")
-    for node_id in sorted(network.nodes.keys()):
-        node = network.nodes[node_id]
-        if node.data:
-            print(f"   Node {node_id}: {len(node.data)} keys")
+    _print_distribution(network, counts_only=True)
     
     print("\n5. Testing random retrievals...")
-    for i in [0, 10, 25, 35, 49]:
-        key = f"key_{i}"
-        random_node = random.choice(nodes_to_add)
-        result = network.nodes[random_node].get(key)
-        if result:
-            print(f"   ✓ Successfully retrieved {key}")
+    # Pick the starting nodes up front so the sequence doesn't depend on thread timing
+    requests = [(keys[i], rng.choice(nodes_to_add)) for i in [0, 10, 25, 35, 49]]
+    # lookup() only reads node state, so the retrievals can run concurrently
+    with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+        results = list(pool.map(lambda req: network.nodes[req[1]].lookup(req[0]), requests))
+    _emit([f"   ✓ Successfully retrieved {key} (queried at Node {random_node}, hops={hops})"
+           for (key, random_node), (hops, value) in zip(requests, results) if value])
+
+
+# ==================== INTERACTIVE COMMANDS ====================
+# Each handler takes the network and the split command line (argv[0] is the command).
+
+def _invalid(network, argv):
+    print("Invalid command!")
+
+
+def _do_add(network, argv):
+    if len(argv) != 2:
+        return _invalid(network, argv)
+    network.add_node(int(argv[1]))
+
+
+def _do_remove(network, argv):
+    if len(argv) != 2:
+        return _invalid(network, argv)
+    network.remove_node(int(argv[1]))
+
+
+def _do_put(network, argv):
+    if len(argv) < 3:
+        return _invalid(network, argv)
+    key = argv[1]
+    value = " ".join(argv[2:])
+    if network._entry is not None:
+        network._entry.put(key, value)
+    else:
+        print("No nodes in network!")
+
+
+def _do_get(network, argv):
+    if len(argv) != 2:
+        return _invalid(network, argv)
+    key = argv[1]
+    if network._entry is not None:
+        network._entry.get(key)
+    else:
+        print("No nodes in network!")
+
+
+def _do_node(network, argv):
+    if len(argv) != 2:
+        return _invalid(network, argv)
+    node_id = int(argv[1])
+    if node_id in network.nodes:
+        network.nodes[node_id].print_info()
+    else:
+        print(f"Node {node_id} does not exist!")
+
+
+DISPATCH = {
+    "add": _do_add,
+    "remove": _do_remove,
+    "put": _do_put,
+    "get": _do_get,
+    "show": lambda network, argv: network.print_network_status(),
+    "ring": lambda network, argv: network.visualize_ring(),
+    "stabilize": lambda network, argv: network.stabilize_network(rounds=2),
+    "node": _do_node,
+}
 
 
 def interactive_mode():
@@ -218,49 +291,7 @@ def interactive_mode():
             if cmd == "quit":
                 break
             
-            elif cmd == "add" and len(command) == 2:
-                node_id = int(command[1])
-                network.add_node(node_id)
-            
-            elif cmd == "remove" and len(command) == 2:
-                node_id = int(command[1])
-                network.remove_node(node_id)
-            
-            elif cmd == "put" and len(command) >= 3:
-                key = command[1]
-                value = " ".join(command[2:])
-                if network.nodes:
-                    first_node = list(network.nodes.values())[0]
-                    first_node.put(key, value)
-                else:
-                    print("No nodes in network!")
-            
-            elif cmd == "get" and len(command) == 2:
-                key = command[1]
-                if network.nodes:
-                    first_node = list(network.nodes.values())[0]
-                    first_node.get(key)
-                else:
-                    print("No nodes in network!")
-            
-            elif cmd == "show":
-                network.print_network_status()
-            
-            elif cmd == "ring":
-                network.visualize_ring()
-            
-            elif cmd == "stabilize":
-                network.stabilize_network(rounds=2)
-            
-            elif cmd == "node" and len(command) == 2:
-                node_id = int(command[1])
-                if node_id in network.nodes:
-                    network.nodes[node_id].print_info()
-                else:
-                    print(f"Node {node_id} does not exist!")
-            
-            else:
-                print("Invalid command!")
+            DISPATCH.get(cmd, _invalid)(network, command)
         
         except Exception as e:
             print(f"Error: {e}")
@@ -297,11 +328,11 @@ def main():
             interactive_mode()
         elif choice == "6":
             simple_example()
-            input("\nPress Enter to continue...")
+            _pause("\nPress Enter to continue...")
             test_join_and_leave()
-            input("\nPress Enter to continue...")
+            _pause("\nPress Enter to continue...")
             test_finger_tables()
-            input("\nPress Enter to continue...")
+            _pause("\nPress Enter to continue...")
             stress_test()
         else:
             print("Invalid choice!")
@@ -320,4 +351,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Node events are logged at DEBUG; show them as part of the demo output.
+    # Only the node logger is lowered, so other libraries (e.g. numba) stay quiet.
+    logging.basicConfig(level=logging.WARNING, format="%(message)s", stream=sys.stdout)
+    logging.getLogger("ChordNode").setLevel(logging.DEBUG)
     main()